@@ -17,21 +17,62 @@ Usage:
 """
 
 import argparse
+import functools
 import json
 import logging
 import os
 import signal
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from enum import Enum
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 from zoneinfo import ZoneInfo
 
 import requests
 import yaml
+from requests.adapters import HTTPAdapter
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# JSON (de)serializers, bound once. orjson is much faster on large library
+# responses; without it fall back to a compact stdlib encoder.
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    _json_encode = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+
+    def _json_dumps(obj: Any) -> bytes:
+        return _json_encode(obj).encode('utf-8')
+
+    _json_loads = json.loads
 
 VERSION = "2.0.0"
 
+# Shortest allowed collection interval in seconds. Servarr data doesn't change
+# faster than this, and shorter intervals only hammer the APIs.
+MIN_INTERVAL = 30
+
+# Most instances collected concurrently; also sizes the shared webhook pool
+MAX_WORKERS = 32
+
+
+class CollectionStatus(Enum):
+    """Outcome of a collection cycle."""
+
+    OK = 'ok'            # Every instance was collected and sent
+    PARTIAL = 'partial'  # Some collections or webhook posts failed
+    FAILED = 'failed'    # No instance could be collected
+
 
 class ServarrConnectionError(Exception):
     """Raised when unable to connect to Servarr API."""
@@ -51,36 +92,269 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Skip thread/process lookups on every log record - the format doesn't use them
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+# Set by SIGINT/SIGTERM. Checked between cycles and between instances so
+# shutdown never interrupts a request in flight.
+SHUTDOWN = threading.Event()
+
+# Set by SIGHUP to force the config file to be re-read on the next cycle
+RELOAD = threading.Event()
+
+# Parsed config per path, with the file's mtime (ns) when it was parsed
+_CONFIG_CACHE: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
+# Whether the missing-libyaml warning was already logged
+_YAML_LOADER_WARNED = False
+
+# Shared by all collectors so posts to the same TRMNL host reuse connections.
+# Kept separate from the per-instance API sessions so API keys never reach it.
+# The pool is sized for the maximum number of concurrent instance workers.
+_webhook_session = requests.Session()
+_webhook_session.mount('https://', HTTPAdapter(pool_maxsize=MAX_WORKERS))
+_webhook_session.mount('http://', HTTPAdapter(pool_maxsize=MAX_WORKERS))
+
+
+@functools.lru_cache(maxsize=64)
+def _zoneinfo(name: str) -> ZoneInfo:
+    """Get a cached ZoneInfo so tzdata is only read once per timezone."""
+    return ZoneInfo(name)
+
+
+def _nested_get(data: Dict, keys: Tuple[str, ...], default: Any = None) -> Any:
+    """Get a value from nested dicts, returning default if any key is missing."""
+    for key in keys:
+        try:
+            data = data[key]
+        except (KeyError, TypeError):
+            return default
+    return data
+
+
+# Friendly explanations for connection errors, matched against the error text
+_CONNECTION_ERROR_HINTS = (
+    (("Name or service not known", "nodename nor servname provided"), "Host not found (check URL)"),
+    (("Connection refused",), "Connection refused (is the service running?)"),
+)
+
+
+def _connection_error_hint(error: str) -> str:
+    """Get a friendly explanation for a connection error, or the error itself."""
+    for markers, hint in _CONNECTION_ERROR_HINTS:
+        if any(marker in error for marker in markers):
+            return hint
+    return error
+
+
+# Seconds to cache responses per API resource. Only slow-changing library data
+# is cached; queue, calendar, history and health are fetched fresh every cycle.
+# Entries are only stored when their TTL outlasts the collection interval,
+# otherwise they could never be hit.
+_ENDPOINT_TTL = {
+    '/series': 300,
+    '/movie': 300,
+    '/artist': 300,
+    '/author': 300,
+    '/book': 300,
+    '/indexer': 900,
+}
+
+
+def _endpoint_ttl(endpoint: str) -> int:
+    """Get cache TTL for an endpoint like '/api/v3/series?foo=bar'."""
+    parts = endpoint.split('?', 1)[0].split('/')
+    if len(parts) < 4:
+        return 0
+    return _ENDPOINT_TTL.get(f'/{parts[3]}', 0)
+
+
+# datetime.fromisoformat() accepts a trailing 'Z' from Python 3.11
+_FROMISOFORMAT_HANDLES_Z = sys.version_info >= (3, 11)
+
+# Shared default for missing nested dicts, so lookups don't allocate a new {}
+_EMPTY: Dict[str, Any] = {}
+
+# Server-side history filter for downloadFolderImported events (eventType 3 in
+# Sonarr/Radarr). Other apps are filtered client-side from a larger page.
+_HISTORY_FILTER = {
+    'sonarr': '&pageSize=10&eventType=3',
+    'radarr': '&pageSize=10&eventType=3',
+}
+
+
+# Detected app type per (url, api_key), shared by collectors pointing at the
+# same instance (e.g. a full and a calendar-only collector for one Sonarr)
+_DETECTED_APP_TYPES: Dict[Tuple[str, str], str] = {}
+
+# Units for _format_bytes, each 1024x the previous
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+
+# API version per app type (Lidarr, Readarr and Prowlarr use v1)
+_API_VERSION = {
+    'sonarr': 'v3',
+    'radarr': 'v3',
+}
+
+# Query params to embed related objects in queue and history records
+_INCLUDE_PARAMS = {
+    'sonarr': '&includeSeries=true&includeEpisode=true',
+    'radarr': '&includeMovie=true',
+    'lidarr': '&includeArtist=true&includeAlbum=true',
+    'readarr': '&includeAuthor=true&includeBook=true',
+}
+
+
+def _record_title_sonarr(record: Dict) -> Optional[str]:
+    """Get title for a Sonarr queue/history record."""
+    if not record.get('series'):
+        return None
+    series = record['series']
+    episode = record.get('episode', {})
+    return f"{series.get('title', 'Unknown')} [S{episode.get('seasonNumber', 0):02d}E{episode.get('episodeNumber', 0):02d}]"
+
+
+def _record_title_radarr(record: Dict) -> Optional[str]:
+    """Get title for a Radarr queue/history record."""
+    if not record.get('movie'):
+        return None
+    movie = record['movie']
+    return f"{movie.get('title', 'Unknown')} ({movie.get('year', '')})"
+
+
+def _record_title_lidarr(record: Dict) -> Optional[str]:
+    """Get title for a Lidarr queue/history record."""
+    if not record.get('artist'):
+        return None
+    artist = record['artist']
+    album = record.get('album', {})
+    return f"{artist.get('artistName', 'Unknown')} - {album.get('title', 'Unknown Album')}"
+
+
+def _record_title_readarr(record: Dict) -> Optional[str]:
+    """Get title for a Readarr queue/history record."""
+    if not record.get('author'):
+        return None
+    author = record['author']
+    book = record.get('book', {})
+    return f"{author.get('authorName', 'Unknown')} - {book.get('title', 'Unknown Book')}"
+
+
+def _record_title_default(record: Dict) -> Optional[str]:
+    """No app-specific title; callers fall back to the record's own title."""
+    return None
+
+
+_RECORD_TITLES: Dict[str, Callable[[Dict], Optional[str]]] = {
+    'sonarr': _record_title_sonarr,
+    'radarr': _record_title_radarr,
+    'lidarr': _record_title_lidarr,
+    'readarr': _record_title_readarr,
+}
+
+
+def _calendar_fields_sonarr(record: Dict) -> Tuple[str, Optional[str], Optional[str]]:
+    """Get (title, air date/time, network) for a Sonarr calendar record."""
+    series = record.get('series', {})
+    title = f"{series.get('title', 'Unknown')} [S{record.get('seasonNumber', 0):02d}E{record.get('episodeNumber', 0):02d}]"
+    return title, record.get('airDateUtc') or record.get('airDate'), series.get('network')
+
+
+def _calendar_fields_radarr(record: Dict) -> Tuple[str, Optional[str], Optional[str]]:
+    """Get (title, air date/time, network) for a Radarr calendar record."""
+    title = f"{record.get('title', 'Unknown')} ({record.get('year', '')})"
+    air_date_time = record.get('digitalRelease') or record.get('physicalRelease') or record.get('inCinemas')
+    return title, air_date_time, None
+
+
+def _calendar_fields_lidarr(record: Dict) -> Tuple[str, Optional[str], Optional[str]]:
+    """Get (title, air date/time, network) for a Lidarr calendar record."""
+    artist = record.get('artist', {})
+    title = f"{artist.get('artistName', 'Unknown')} - {record.get('title', 'Unknown')}"
+    return title, record.get('releaseDate'), None
+
+
+def _calendar_fields_readarr(record: Dict) -> Tuple[str, Optional[str], Optional[str]]:
+    """Get (title, air date/time, network) for a Readarr calendar record."""
+    author = record.get('author', {})
+    title = f"{author.get('authorName', 'Unknown')} - {record.get('title', 'Unknown')}"
+    return title, record.get('releaseDate'), None
+
+
+def _calendar_fields_default(record: Dict) -> Tuple[str, Optional[str], Optional[str]]:
+    """Fallback for app types without a calendar."""
+    return 'Unknown', None, None
+
+
+_CALENDAR_FIELDS: Dict[str, Callable[[Dict], Tuple[str, Optional[str], Optional[str]]]] = {
+    'sonarr': _calendar_fields_sonarr,
+    'radarr': _calendar_fields_radarr,
+    'lidarr': _calendar_fields_lidarr,
+    'readarr': _calendar_fields_readarr,
+}
+
+
+@dataclass(frozen=True)
+class CollectorSpec:
+    """Validated, immutable settings for one collector."""
+
+    name: str
+    url: str
+    api_key: str
+    webhook: Optional[str] = None
+    app_type: Optional[str] = None
+    calendar_days: int = 7
+    calendar_days_before: int = 0
+    calendar_only: bool = False
+    timezone: Optional[str] = None
+    verbose: bool = False
+    dry_run: bool = False
+    use_cache: bool = True
+    force_detect: bool = False
+    interval: int = 0
+
 
 class ServarrCollector:
     """Collector for a single Servarr instance."""
 
-    def __init__(
-        self,
-        name: str,
-        url: str,
-        api_key: str,
-        webhook: Optional[str] = None,
-        app_type: Optional[str] = None,
-        calendar_days: int = 7,
-        calendar_days_before: int = 0,
-        calendar_only: bool = False,
-        timezone: Optional[str] = None,
-        verbose: bool = False,
-        dry_run: bool = False,
-    ):
-        self.name = name
-        self.url = url.rstrip('/')
-        self.api_key = api_key
-        self.webhook = webhook
-        self.app_type = app_type
-        self.calendar_days = calendar_days
-        self.calendar_days_before = calendar_days_before
-        self.calendar_only = calendar_only
-        self.timezone = timezone or os.environ.get('TZ', '')
-        self.verbose = verbose
-        self.dry_run = dry_run
+    def __init__(self, spec: CollectorSpec):
+        self.spec = spec
+        self.timezone = spec.timezone or os.environ.get('TZ', '')
         self.api_version = None
+        # Whether any request reached the instance this collection, and the
+        # last connection error if one didn't
+        self._reached = False
+        self._connect_error = None
+        # Cached responses per endpoint as (expires_at, data)
+        self._cache: Dict[str, Tuple[float, Any]] = {}
+        self._cache_lock = threading.Lock()
+
+        # Keep-alive session so repeated requests reuse the same connection.
+        # The pool is sized for the concurrent endpoint fetches in collect().
+        self._session = requests.Session()
+        self._session.headers.update({
+            'X-Api-Key': spec.api_key,
+            'Content-Type': 'application/json'
+        })
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=8)
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+
+    def _cache_store(self, endpoint: str, data: Any, ttl: int) -> None:
+        """Cache a response and drop expired entries.
+
+        Endpoints like the calendar embed dates in their URL, so stale keys
+        must be evicted or the cache grows for as long as the process runs.
+        """
+        now = time.monotonic()
+        with self._cache_lock:
+            expired = [key for key, (expires_at, _) in self._cache.items() if expires_at <= now]
+            for key in expired:
+                del self._cache[key]
+            self._cache[endpoint] = (now + ttl, data)
 
     def _api_request(self, endpoint: str, raise_on_error: bool = False) -> Dict[str, Any]:
         """Make API request to Servarr.
@@ -89,68 +363,96 @@ class ServarrCollector:
             endpoint: API endpoint to call
             raise_on_error: If True, raise exceptions instead of returning {}
 
+        Successful responses are cached per endpoint for the TTL in
+        _ENDPOINT_TTL when caching is enabled and the TTL outlasts the
+        collection interval.
+
         Raises:
             ServarrConnectionError: When unable to connect to the API
             ServarrAuthenticationError: When API key is invalid (401/403)
         """
-        url = f"{self.url}{endpoint}"
-        headers = {
-            'X-Api-Key': self.api_key,
-            'Content-Type': 'application/json'
-        }
+        ttl = 0
+        if self.spec.use_cache and self.spec.interval > 0 and not raise_on_error:
+            ttl = _endpoint_ttl(endpoint)
+            if ttl <= self.spec.interval:
+                ttl = 0
+        if ttl:
+            with self._cache_lock:
+                cached = self._cache.get(endpoint)
+            if cached and time.monotonic() < cached[0]:
+                return cached[1]
+
+        url = f"{self.spec.url}{endpoint}"
         try:
-            response = requests.get(url, headers=headers, timeout=30)
+            response = self._session.get(url, timeout=30)
+            self._reached = True
             response.raise_for_status()
-            return response.json()
+            data = _json_loads(response.content)
+            if ttl:
+                self._cache_store(endpoint, data, ttl)
+            return data
         except requests.exceptions.ConnectionError as e:
-            error_msg = f"Cannot connect to {self.url}: "
-            if "Name or service not known" in str(e) or "nodename nor servname provided" in str(e):
-                error_msg += "Host not found (check URL)"
-            elif "Connection refused" in str(e):
-                error_msg += "Connection refused (is the service running?)"
-            else:
-                error_msg += str(e)
+            error_msg = f"Cannot connect to {self.spec.url}: {_connection_error_hint(str(e))}"
             if raise_on_error:
                 raise ServarrConnectionError(error_msg) from e
-            if self.verbose:
+            self._connect_error = error_msg
+            if self.spec.verbose:
                 logger.error(error_msg)
             return {}
         except requests.exceptions.Timeout as e:
-            error_msg = f"Cannot connect to {self.url}: Request timed out"
+            error_msg = f"Cannot connect to {self.spec.url}: Request timed out"
             if raise_on_error:
                 raise ServarrConnectionError(error_msg) from e
-            if self.verbose:
+            self._connect_error = error_msg
+            if self.spec.verbose:
                 logger.error(error_msg)
             return {}
         except requests.exceptions.HTTPError as e:
             if e.response is not None and e.response.status_code in (401, 403):
-                error_msg = f"Authentication failed for {self.url}: Invalid API key (HTTP {e.response.status_code})"
+                error_msg = f"Authentication failed for {self.spec.url}: Invalid API key (HTTP {e.response.status_code})"
                 if raise_on_error:
                     raise ServarrAuthenticationError(error_msg) from e
                 logger.error(error_msg)
                 return {}
             if raise_on_error:
                 raise
-            if self.verbose:
+            if self.spec.verbose:
                 logger.error(f"API request failed: {e}")
             return {}
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, json.JSONDecodeError) as e:
             if raise_on_error:
-                raise ServarrConnectionError(f"Cannot connect to {self.url}: {e}") from e
-            if self.verbose:
+                raise ServarrConnectionError(f"Cannot connect to {self.spec.url}: {e}") from e
+            if self.spec.verbose:
                 logger.error(f"API request failed: {e}")
             return {}
 
+    def _api_requests(self, *endpoints: str) -> List[Any]:
+        """Make several independent API requests concurrently.
+
+        Returns:
+            Responses in the same order as the endpoints
+        """
+        with ThreadPoolExecutor(max_workers=len(endpoints)) as executor:
+            return list(executor.map(self._api_request, endpoints))
+
     def detect_app_type(self) -> str:
         """Detect app type from system status.
 
+        The result is cached for later collections, and shared with other
+        collectors for the same instance, unless force_detect is set.
+
         Raises:
             ServarrConnectionError: When unable to connect to the API
             ServarrAuthenticationError: When API key is invalid
             ValueError: When connected but app type cannot be determined
         """
-        if self.app_type:
-            return self.app_type.lower()
+        if self.spec.app_type:
+            return self.spec.app_type.lower()
+
+        if not self.spec.force_detect:
+            detected = _DETECTED_APP_TYPES.get((self.spec.url, self.spec.api_key))
+            if detected:
+                return detected
 
         # Try v3 API first (Sonarr, Radarr) - raise on connection/auth errors
         try:
@@ -161,40 +463,30 @@ class ServarrCollector:
                 status = self._api_request('/api/v1/system/status', raise_on_error=True)
             except ServarrConnectionError as e:
                 # Both APIs failed - re-raise with clear message
-                raise ServarrConnectionError(f"Cannot connect to {self.url}: Check URL and ensure service is running") from e
+                raise ServarrConnectionError(f"Cannot connect to {self.spec.url}: Check URL and ensure service is running") from e
         except ServarrAuthenticationError:
             # Auth error on v3, try v1 in case it's a v1 app
             try:
                 status = self._api_request('/api/v1/system/status', raise_on_error=True)
             except (ServarrConnectionError, ServarrAuthenticationError) as e:
-                raise ServarrAuthenticationError(f"Authentication failed for {self.url}: Check API key") from e
+                raise ServarrAuthenticationError(f"Authentication failed for {self.spec.url}: Check API key") from e
 
         app_name = status.get('appName', '').lower()
         if not app_name:
             raise ValueError(
-                f"Connected to {self.url} but could not detect app type. "
+                f"Connected to {self.spec.url} but could not detect app type. "
                 f"Please specify with 'type' in config (sonarr, radarr, lidarr, readarr, or prowlarr)."
             )
 
+        _DETECTED_APP_TYPES[(self.spec.url, self.spec.api_key)] = app_name
         return app_name
 
-    def _get_api_version(self, app_type: str) -> str:
-        """Get API version based on app type."""
-        if app_type in ('sonarr', 'radarr'):
-            return 'v3'
-        return 'v1'
-
     def fetch_queue(self, app_type: str) -> Dict[str, Any]:
         """Fetch and transform queue data."""
-        include_params = {
-            'sonarr': '&includeSeries=true&includeEpisode=true',
-            'radarr': '&includeMovie=true',
-            'lidarr': '&includeArtist=true&includeAlbum=true',
-            'readarr': '&includeAuthor=true&includeBook=true',
-        }.get(app_type, '')
+        include_params = _INCLUDE_PARAMS.get(app_type, '')
 
         data = self._api_request(
-            f'/api/{self.api_version}/queue?pageSize=20&includeUnknownSeriesItems=false{include_params}'
+            f'/api/{self.api_version}/queue?pageSize=10&includeUnknownSeriesItems=false{include_params}'
         )
 
         if not data:
@@ -202,55 +494,36 @@ class ServarrCollector:
 
         count = data.get('totalRecords', len(data.get('records', [])))
         items = []
+        record_title = _RECORD_TITLES.get(app_type, _record_title_default)
 
         for record in data.get('records', [])[:10]:
-            item = self._format_queue_item(record, app_type)
+            item = self._format_queue_item(record, record_title)
             if item:
                 items.append(item)
 
         return {'count': count, 'items': items}
 
-    def _format_queue_item(self, record: Dict, app_type: str) -> Dict[str, Any]:
-        """Format a queue record based on app type."""
-        title = 'Unknown'
-
-        if app_type == 'sonarr' and record.get('series'):
-            series = record['series']
-            episode = record.get('episode', {})
-            season = str(episode.get('seasonNumber', 0)).zfill(2)
-            ep_num = str(episode.get('episodeNumber', 0)).zfill(2)
-            title = f"{series.get('title', 'Unknown')} [S{season}E{ep_num}]"
-        elif app_type == 'radarr' and record.get('movie'):
-            movie = record['movie']
-            title = f"{movie.get('title', 'Unknown')} ({movie.get('year', '')})"
-        elif app_type == 'lidarr' and record.get('artist'):
-            artist = record['artist']
-            album = record.get('album', {})
-            title = f"{artist.get('artistName', 'Unknown')} - {album.get('title', 'Unknown Album')}"
-        elif app_type == 'readarr' and record.get('author'):
-            author = record['author']
-            book = record.get('book', {})
-            title = f"{author.get('authorName', 'Unknown')} - {book.get('title', 'Unknown Book')}"
-        else:
-            title = record.get('title', 'Unknown')
+    def _format_queue_item(self, record: Dict, record_title: Callable[[Dict], Optional[str]]) -> Dict[str, Any]:
+        """Format a queue record using the app type's title function."""
+        get = record.get
+        title = record_title(record) or get('title', 'Unknown')
 
-        size = record.get('size', 0)
-        sizeleft = record.get('sizeleft', 0)
+        size = get('size', 0)
+        sizeleft = get('sizeleft', 0)
         progress = int((size - sizeleft) / size * 100) if size > 0 else 0
 
         return {
             'title': title,
-            'quality': record.get('quality', {}).get('quality', {}).get('name', 'Unknown'),
-            'status': record.get('status', 'unknown'),
+            'quality': _nested_get(record, ('quality', 'quality', 'name'), 'Unknown'),
+            'status': get('status', 'unknown'),
             'progress': progress,
-            'eta': record.get('timeleft', 'pending'),
+            'eta': get('timeleft', 'pending'),
         }
 
-    def fetch_calendar(self, app_type: str) -> Dict[str, Any]:
-        """Fetch and transform calendar data."""
-        today = datetime.now()
-        start_date = (today - timedelta(days=self.calendar_days_before)).strftime('%Y-%m-%d')
-        end_date = (today + timedelta(days=self.calendar_days)).strftime('%Y-%m-%d')
+    def fetch_calendar(self, app_type: str, today: datetime) -> Dict[str, Any]:
+        """Fetch and transform calendar data relative to today (naive local time)."""
+        start_date = (today - timedelta(days=self.spec.calendar_days_before)).strftime('%Y-%m-%d')
+        end_date = (today + timedelta(days=self.spec.calendar_days)).strftime('%Y-%m-%d')
 
         data = self._api_request(
             f'/api/{self.api_version}/calendar?start={start_date}&end={end_date}&unmonitored=false&includeSeries=true'
@@ -261,39 +534,24 @@ class ServarrCollector:
 
         count = len(data)
         items = []
+        calendar_fields = _CALENDAR_FIELDS.get(app_type, _calendar_fields_default)
 
         for record in data[:10]:
-            item = self._format_calendar_item(record, app_type, today)
+            item = self._format_calendar_item(record, calendar_fields, today)
             if item:
                 items.append(item)
 
         return {'count': count, 'items': items}
 
-    def _format_calendar_item(self, record: Dict, app_type: str, today: datetime) -> Dict[str, Any]:
-        """Format a calendar record based on app type."""
-        title = 'Unknown'
+    def _format_calendar_item(
+        self,
+        record: Dict,
+        calendar_fields: Callable[[Dict], Tuple[str, Optional[str], Optional[str]]],
+        today: datetime,
+    ) -> Dict[str, Any]:
+        """Format a calendar record using the app type's field function."""
         air_date = None
-        air_date_time = None
-        network = None
-
-        if app_type == 'sonarr':
-            series = record.get('series', {})
-            season = str(record.get('seasonNumber', 0)).zfill(2)
-            ep_num = str(record.get('episodeNumber', 0)).zfill(2)
-            title = f"{series.get('title', 'Unknown')} [S{season}E{ep_num}]"
-            air_date_time = record.get('airDateUtc') or record.get('airDate')
-            network = series.get('network')
-        elif app_type == 'radarr':
-            title = f"{record.get('title', 'Unknown')} ({record.get('year', '')})"
-            air_date_time = record.get('digitalRelease') or record.get('physicalRelease') or record.get('inCinemas')
-        elif app_type == 'lidarr':
-            artist = record.get('artist', {})
-            title = f"{artist.get('artistName', 'Unknown')} - {record.get('title', 'Unknown')}"
-            air_date_time = record.get('releaseDate')
-        elif app_type == 'readarr':
-            author = record.get('author', {})
-            title = f"{author.get('authorName', 'Unknown')} - {record.get('title', 'Unknown')}"
-            air_date_time = record.get('releaseDate')
+        title, air_date_time, network = calendar_fields(record)
 
         # Parse air date
         if air_date_time:
@@ -346,16 +604,21 @@ class ServarrCollector:
 
     def _fetch_stats_sonarr(self) -> Dict[str, Any]:
         """Fetch Sonarr statistics."""
-        series_data = self._api_request('/api/v3/series')
-        wanted_data = self._api_request('/api/v3/wanted/missing?pageSize=1')
+        series_data, wanted_data = self._api_requests(
+            '/api/v3/series',
+            '/api/v3/wanted/missing?pageSize=1',
+        )
 
         if not series_data:
             return {}
 
         total_series = len(series_data)
-        total_episodes = sum(s.get('statistics', {}).get('totalEpisodeCount', 0) for s in series_data)
-        episodes_on_disk = sum(s.get('statistics', {}).get('episodeFileCount', 0) for s in series_data)
-        library_size = sum(s.get('statistics', {}).get('sizeOnDisk', 0) for s in series_data)
+        total_episodes = episodes_on_disk = library_size = 0
+        for series in series_data:
+            statistics = series.get('statistics') or _EMPTY
+            total_episodes += statistics.get('totalEpisodeCount', 0)
+            episodes_on_disk += statistics.get('episodeFileCount', 0)
+            library_size += statistics.get('sizeOnDisk', 0)
         monitored_missing = wanted_data.get('totalRecords', 0)
 
         return {
@@ -370,15 +633,20 @@ class ServarrCollector:
 
     def _fetch_stats_radarr(self) -> Dict[str, Any]:
         """Fetch Radarr statistics."""
-        movie_data = self._api_request('/api/v3/movie')
-        wanted_data = self._api_request('/api/v3/wanted/missing?pageSize=1')
+        movie_data, wanted_data = self._api_requests(
+            '/api/v3/movie',
+            '/api/v3/wanted/missing?pageSize=1',
+        )
 
         if not movie_data:
             return {}
 
         total_movies = len(movie_data)
-        movies_on_disk = sum(1 for m in movie_data if m.get('hasFile'))
-        library_size = sum(m.get('sizeOnDisk', 0) for m in movie_data)
+        movies_on_disk = library_size = 0
+        for movie in movie_data:
+            if movie.get('hasFile'):
+                movies_on_disk += 1
+            library_size += movie.get('sizeOnDisk', 0)
         monitored_missing = wanted_data.get('totalRecords', 0)
 
         return {
@@ -392,16 +660,21 @@ class ServarrCollector:
 
     def _fetch_stats_lidarr(self) -> Dict[str, Any]:
         """Fetch Lidarr statistics."""
-        artist_data = self._api_request('/api/v1/artist')
-        wanted_data = self._api_request('/api/v1/wanted/missing?pageSize=1')
+        artist_data, wanted_data = self._api_requests(
+            '/api/v1/artist',
+            '/api/v1/wanted/missing?pageSize=1',
+        )
 
         if not artist_data:
             return {}
 
         total_artists = len(artist_data)
-        total_albums = sum(a.get('statistics', {}).get('albumCount', 0) for a in artist_data)
-        total_tracks = sum(a.get('statistics', {}).get('trackCount', 0) for a in artist_data)
-        library_size = sum(a.get('statistics', {}).get('sizeOnDisk', 0) for a in artist_data)
+        total_albums = total_tracks = library_size = 0
+        for artist in artist_data:
+            statistics = artist.get('statistics') or _EMPTY
+            total_albums += statistics.get('albumCount', 0)
+            total_tracks += statistics.get('trackCount', 0)
+            library_size += statistics.get('sizeOnDisk', 0)
         monitored_missing = wanted_data.get('totalRecords', 0)
 
         return {
@@ -415,14 +688,21 @@ class ServarrCollector:
 
     def _fetch_stats_readarr(self) -> Dict[str, Any]:
         """Fetch Readarr statistics."""
-        author_data = self._api_request('/api/v1/author')
-        book_data = self._api_request('/api/v1/book')
-        wanted_data = self._api_request('/api/v1/wanted/missing?pageSize=1')
+        author_data, book_data, wanted_data = self._api_requests(
+            '/api/v1/author',
+            '/api/v1/book',
+            '/api/v1/wanted/missing?pageSize=1',
+        )
 
         total_authors = len(author_data) if author_data else 0
         total_books = len(book_data) if book_data else 0
-        books_on_disk = sum(1 for b in (book_data or []) if b.get('statistics', {}).get('bookFileCount', 0) > 0)
-        library_size = sum(a.get('statistics', {}).get('sizeOnDisk', 0) for a in (author_data or []))
+        books_on_disk = 0
+        for book in book_data or ():
+            if (book.get('statistics') or _EMPTY).get('bookFileCount', 0) > 0:
+                books_on_disk += 1
+        library_size = 0
+        for author in author_data or ():
+            library_size += (author.get('statistics') or _EMPTY).get('sizeOnDisk', 0)
         monitored_missing = wanted_data.get('totalRecords', 0) if wanted_data else 0
 
         return {
@@ -436,8 +716,10 @@ class ServarrCollector:
 
     def _fetch_stats_prowlarr(self) -> Dict[str, Any]:
         """Fetch Prowlarr statistics."""
-        indexer_data = self._api_request('/api/v1/indexer')
-        stats_data = self._api_request('/api/v1/indexerstats')
+        indexer_data, stats_data = self._api_requests(
+            '/api/v1/indexer',
+            '/api/v1/indexerstats',
+        )
 
         total_indexers = len(indexer_data) if indexer_data else 0
         enabled_indexers = sum(1 for i in (indexer_data or []) if i.get('enable'))
@@ -463,61 +745,44 @@ class ServarrCollector:
             'failed_queries': failed_queries,
         }
 
-    def fetch_recently_added(self, app_type: str) -> Dict[str, Any]:
-        """Fetch recently added items from history."""
+    def fetch_recently_added(self, app_type: str, now: datetime) -> Dict[str, Any]:
+        """Fetch recently added items from history relative to now (aware UTC)."""
         if app_type == 'prowlarr':
             return {'count': 0, 'items': []}
 
-        include_params = {
-            'sonarr': '&includeSeries=true&includeEpisode=true',
-            'radarr': '&includeMovie=true',
-            'lidarr': '&includeArtist=true&includeAlbum=true',
-            'readarr': '&includeAuthor=true&includeBook=true',
-        }.get(app_type, '')
+        include_params = _INCLUDE_PARAMS.get(app_type, '')
+        history_filter = _HISTORY_FILTER.get(app_type, '&pageSize=50')
 
         data = self._api_request(
-            f'/api/{self.api_version}/history?pageSize=50&sortKey=date&sortDirection=descending{include_params}'
+            f'/api/{self.api_version}/history?sortKey=date&sortDirection=descending{history_filter}{include_params}'
         )
 
         if not data or not data.get('records'):
             return {'count': 0, 'items': []}
 
-        # Filter for downloadFolderImported events
-        imported = [r for r in data['records'] if r.get('eventType') == 'downloadFolderImported'][:10]
+        # Filter for downloadFolderImported events, stopping once 10 are found
+        imported = list(islice(
+            (r for r in data['records'] if r.get('eventType') == 'downloadFolderImported'), 10
+        ))
 
         items = []
-        now = datetime.now()
+        record_title = _RECORD_TITLES.get(app_type, _record_title_default)
 
-        for record in imported[:6]:
-            item = self._format_recently_added_item(record, app_type, now)
+        for record in islice(imported, 6):
+            item = self._format_recently_added_item(record, record_title, now)
             if item:
                 items.append(item)
 
         return {'count': len(imported), 'items': items}
 
-    def _format_recently_added_item(self, record: Dict, app_type: str, now: datetime) -> Dict[str, Any]:
+    def _format_recently_added_item(
+        self,
+        record: Dict,
+        record_title: Callable[[Dict], Optional[str]],
+        now: datetime,
+    ) -> Dict[str, Any]:
         """Format a recently added record."""
-        title = 'Unknown'
-
-        if app_type == 'sonarr' and record.get('series'):
-            series = record['series']
-            episode = record.get('episode', {})
-            season = str(episode.get('seasonNumber', 0)).zfill(2)
-            ep_num = str(episode.get('episodeNumber', 0)).zfill(2)
-            title = f"{series.get('title', 'Unknown')} [S{season}E{ep_num}]"
-        elif app_type == 'radarr' and record.get('movie'):
-            movie = record['movie']
-            title = f"{movie.get('title', 'Unknown')} ({movie.get('year', '')})"
-        elif app_type == 'lidarr' and record.get('artist'):
-            artist = record['artist']
-            album = record.get('album', {})
-            title = f"{artist.get('artistName', 'Unknown')} - {album.get('title', 'Unknown Album')}"
-        elif app_type == 'readarr' and record.get('author'):
-            author = record['author']
-            book = record.get('book', {})
-            title = f"{author.get('authorName', 'Unknown')} - {book.get('title', 'Unknown Book')}"
-        else:
-            title = record.get('sourceTitle', 'Unknown')
+        title = record_title(record) or record.get('sourceTitle', 'Unknown')
 
         # Calculate relative time
         time_ago = self._calc_relative_time(record.get('date'), now)
@@ -528,14 +793,15 @@ class ServarrCollector:
         }
 
     def _calc_relative_time(self, date_str: Optional[str], now: datetime) -> str:
-        """Calculate relative time string."""
+        """Calculate relative time string from an ISO date and an aware UTC now."""
         if not date_str:
             return ''
 
         try:
             # Parse ISO format
-            event_time = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-            event_time = event_time.replace(tzinfo=None)  # Remove timezone for comparison
+            if not _FROMISOFORMAT_HANDLES_Z:
+                date_str = date_str.replace('Z', '+00:00')
+            event_time = datetime.fromisoformat(date_str)
             diff = now - event_time
             seconds = int(diff.total_seconds())
 
@@ -559,68 +825,84 @@ class ServarrCollector:
         if not size:
             return '--'
 
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if abs(size) < 1024:
-                return f'{size:.1f} {unit}'
-            size /= 1024
-        return f'{size:.1f} PB'
+        # Every 10 bits is one 1024x unit step
+        idx = min(max(int(abs(size)).bit_length() - 1, 0) // 10, len(_BYTE_UNITS) - 1)
+        return f'{size / (1 << (idx * 10)):.1f} {_BYTE_UNITS[idx]}'
 
-    def _get_timezone_abbrev(self) -> str:
-        """Get timezone abbreviation from configured timezone."""
+    def _get_timezone_abbrev(self, now: datetime) -> str:
+        """Get timezone abbreviation from configured timezone at now (aware UTC)."""
         if not self.timezone:
             return 'UTC'
 
         try:
-            tz = ZoneInfo(self.timezone)
-            now = datetime.now(tz)
+            tz = _zoneinfo(self.timezone)
             # Get the abbreviation (e.g., EST, PST, UTC)
-            abbrev = now.strftime('%Z')
-            return abbrev if abbrev else self.timezone
+            return now.astimezone(tz).strftime('%Z') or self.timezone
         except Exception:
-            # If timezone is invalid, return it as-is or UTC
-            return self.timezone if self.timezone else 'UTC'
+            # If timezone is invalid, return it as-is
+            return self.timezone
 
     def collect(self) -> Dict[str, Any]:
-        """Collect all data from this instance."""
-        logger.info(f"[{self.name}] Collecting data from {self.url}")
+        """Collect all data from this instance.
+
+        Raises:
+            ServarrConnectionError: When the instance could not be reached
+            ServarrAuthenticationError: When API key is invalid
+            ValueError: When connected but app type cannot be determined
+        """
+        logger.info(f"[{self.spec.name}] Collecting data from {self.spec.url}")
+        self._reached = False
+        self._connect_error = None
 
         # Detect app type
         app_type = self.detect_app_type()
-        self.api_version = self._get_api_version(app_type)
-        logger.info(f"[{self.name}] Detected app type: {app_type}, API version: {self.api_version}")
+        self.api_version = _API_VERSION.get(app_type, 'v1')
+        logger.info(f"[{self.spec.name}] Detected app type: {app_type}, API version: {self.api_version}")
+
+        # Read the clock once per collection and share it with every fetch
+        now_utc = datetime.now(timezone.utc)
+        now_local = now_utc.astimezone().replace(tzinfo=None)
+        last_updated = now_utc.strftime('%Y-%m-%dT%H:%M:%SZ')
 
         # Get timezone abbreviation for display
-        tz_abbrev = self._get_timezone_abbrev()
+        tz_abbrev = self._get_timezone_abbrev(now_utc)
 
         # Use custom name if provided, otherwise use app type in title case
-        display_name = self.name if self.name else app_type.capitalize()
+        display_name = self.spec.name if self.spec.name else app_type.capitalize()
 
         # Build payload
-        if self.calendar_only:
+        if self.spec.calendar_only:
             # Calendar only mode - minimal payload
-            calendar = self.fetch_calendar(app_type)
+            calendar = self.fetch_calendar(app_type, now_local)
             payload = {
                 'merge_variables': {
                     'app_name': display_name,
                     'app_type': app_type,
-                    'last_updated': datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+                    'last_updated': last_updated,
                     'timezone': tz_abbrev,
                     'calendar': calendar,
                 }
             }
         else:
-            # Full payload
-            queue = self.fetch_queue(app_type)
-            calendar = self.fetch_calendar(app_type)
-            health = self.fetch_health()
-            stats = self.fetch_stats(app_type)
-            recently_added = self.fetch_recently_added(app_type)
+            # Full payload - endpoints are independent, so fetch them concurrently
+            with ThreadPoolExecutor(max_workers=5) as executor:
+                queue_future = executor.submit(self.fetch_queue, app_type)
+                calendar_future = executor.submit(self.fetch_calendar, app_type, now_local)
+                health_future = executor.submit(self.fetch_health)
+                stats_future = executor.submit(self.fetch_stats, app_type)
+                recently_added_future = executor.submit(self.fetch_recently_added, app_type, now_utc)
+
+            queue = queue_future.result()
+            calendar = calendar_future.result()
+            health = health_future.result()
+            stats = stats_future.result()
+            recently_added = recently_added_future.result()
 
             payload = {
                 'merge_variables': {
                     'app_name': display_name,
                     'app_type': app_type,
-                    'last_updated': datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+                    'last_updated': last_updated,
                     'timezone': tz_abbrev,
                     'health': health,
                     'queue': queue,
@@ -630,56 +912,115 @@ class ServarrCollector:
                 }
             }
 
+        # Fetches swallow errors, so with a cached app type nothing else would
+        # notice the instance going down. If no request got through, fail the
+        # collection instead of sending an empty payload, and re-probe next time.
+        if self._connect_error and not self._reached:
+            _DETECTED_APP_TYPES.pop((self.spec.url, self.spec.api_key), None)
+            raise ServarrConnectionError(self._connect_error)
+
         return payload
 
     def send(self, payload: Dict[str, Any]) -> bool:
         """Send payload to webhook."""
-        payload_json = json.dumps(payload)
-        payload_size = len(payload_json)
+        # Serialize straight to bytes so requests sends the body as-is
+        body = _json_dumps(payload)
+        payload_size = len(body)
 
-        if self.verbose:
-            logger.info(f"[{self.name}] Payload size: {payload_size} bytes")
+        if self.spec.verbose:
+            logger.info(f"[{self.spec.name}] Payload size: {payload_size} bytes")
 
         # Dry run or no webhook - print to stdout
-        if self.dry_run or not self.webhook:
+        if self.spec.dry_run or not self.spec.webhook:
             print(json.dumps(payload, indent=2))
             return True
 
         # Send to webhook
-        logger.info(f"[{self.name}] Sending data to TRMNL webhook...")
+        logger.info(f"[{self.spec.name}] Sending data to TRMNL webhook...")
         try:
-            response = requests.post(
-                self.webhook,
+            response = _webhook_session.post(
+                self.spec.webhook,
                 headers={'Content-Type': 'application/json'},
-                data=payload_json,
+                data=body,
                 timeout=30
             )
             response.raise_for_status()
-            logger.info(f"[{self.name}] Successfully sent data (HTTP {response.status_code})")
+            logger.info(f"[{self.spec.name}] Successfully sent data (HTTP {response.status_code})")
             return True
         except requests.exceptions.RequestException as e:
-            logger.error(f"[{self.name}] Failed to send data: {e}")
-            if self.verbose and hasattr(e, 'response') and e.response is not None:
-                logger.error(f"[{self.name}] Response: {e.response.text}")
+            logger.error(f"[{self.spec.name}] Failed to send data: {e}")
+            if self.spec.verbose and hasattr(e, 'response') and e.response is not None:
+                logger.error(f"[{self.spec.name}] Response: {e.response.text}")
             return False
 
 
 def load_config(config_path: str) -> Dict[str, Any]:
-    """Load configuration from YAML file."""
-    with open(config_path, 'r') as f:
-        return yaml.safe_load(f)
+    """Load configuration from YAML file.
+
+    The parsed config is cached and only re-read when the file's mtime changes,
+    so this is cheap to call every cycle.
+    """
+    global _YAML_LOADER_WARNED
+    mtime = os.stat(config_path).st_mtime_ns
+    cached = _CONFIG_CACHE.get(config_path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    if _YamlLoader is yaml.SafeLoader and not _YAML_LOADER_WARNED:
+        _YAML_LOADER_WARNED = True
+        logger.warning(
+            "PyYAML was built without libyaml, config will be parsed in pure Python. "
+            "Install libyaml headers and run 'pip install pyyaml --no-binary=:all:' for the C loader."
+        )
+    with open(config_path, 'rb') as f:
+        config = yaml.load(f, Loader=_YamlLoader)
+
+    _CONFIG_CACHE[config_path] = (mtime, config)
+    return config
+
+
+def resolve_workers(value: Any) -> int:
+    """Validate a worker count from the config file or CLI.
 
+    Args:
+        value: Requested worker count (0 = one per instance)
 
-def create_collectors_from_config(config: Dict[str, Any], args: argparse.Namespace) -> List[ServarrCollector]:
-    """Create collector instances from config file."""
-    collectors = []
+    Returns:
+        The worker count, capped at MAX_WORKERS
+
+    Raises:
+        ValueError: If the value is not a non-negative integer
+    """
+    if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+        raise ValueError(f"workers must be a non-negative integer, got {value!r}")
+    if value > MAX_WORKERS:
+        logger.warning("workers %d is above the maximum of %d; using %d", value, MAX_WORKERS, MAX_WORKERS)
+        return MAX_WORKERS
+    return value
+
+
+def create_specs_from_config(
+    config: Dict[str, Any],
+    args: argparse.Namespace,
+    interval: int = 0,
+) -> Tuple[CollectorSpec, ...]:
+    """Create collector specs from config file.
+
+    Raises:
+        ValueError: When an instance is missing its url or api_key
+    """
+    specs = []
     defaults = config.get('defaults', {})
     global_timezone = config.get('timezone', args.timezone)
 
-    for instance in config.get('instances', []):
-        collector = ServarrCollector(
-            name=instance.get('name', instance.get('url', 'unknown')),
-            url=instance['url'],
+    for index, instance in enumerate(config.get('instances', []), start=1):
+        for key in ('url', 'api_key'):
+            if not instance.get(key):
+                raise ValueError(f"Instance {index} ({instance.get('name', 'unnamed')}) is missing '{key}'")
+
+        specs.append(CollectorSpec(
+            name=instance.get('name', instance['url']),
+            url=instance['url'].rstrip('/'),
             api_key=instance['api_key'],
             webhook=instance.get('webhook'),
             app_type=instance.get('type'),
@@ -689,17 +1030,19 @@ def create_collectors_from_config(config: Dict[str, Any], args: argparse.Namespa
             timezone=global_timezone,
             verbose=args.verbose,
             dry_run=args.dry_run,
-        )
-        collectors.append(collector)
+            use_cache=not args.no_cache,
+            force_detect=args.force_detect,
+            interval=interval,
+        ))
 
-    return collectors
+    return tuple(specs)
 
 
-def create_collector_from_args(args: argparse.Namespace) -> ServarrCollector:
-    """Create a single collector from CLI arguments."""
-    return ServarrCollector(
+def create_spec_from_args(args: argparse.Namespace, interval: int = 0) -> CollectorSpec:
+    """Create a single collector spec from CLI arguments."""
+    return CollectorSpec(
         name=args.name,
-        url=args.url,
+        url=args.url.rstrip('/'),
         api_key=args.api_key,
         webhook=args.webhook,
         app_type=args.type,
@@ -709,45 +1052,97 @@ def create_collector_from_args(args: argparse.Namespace) -> ServarrCollector:
         timezone=args.timezone,
         verbose=args.verbose,
         dry_run=args.dry_run,
+        use_cache=not args.no_cache,
+        force_detect=args.force_detect,
+        interval=interval,
     )
 
 
-def run_collection(collectors: List[ServarrCollector]) -> bool:
-    """Run collection for all instances."""
-    logger.info(f"Starting collection cycle at {datetime.now()}")
+def build_collectors(
+    specs: Iterable[CollectorSpec],
+    existing: Iterable[ServarrCollector] = (),
+) -> Tuple[ServarrCollector, ...]:
+    """Create collectors for specs, reusing existing collectors whose spec is unchanged.
+
+    Reused collectors keep their sessions and response caches.
+    """
+    by_spec = {collector.spec: collector for collector in existing}
+    return tuple(by_spec.get(spec) or ServarrCollector(spec) for spec in specs)
+
+
+def _run_one(collector: ServarrCollector) -> Tuple[str, Optional[str], bool]:
+    """Collect and send for a single instance.
+
+    Returns:
+        Tuple of (name, reason, collected) where reason is None on success and
+        collected is False when the instance could not be reached or collection
+        raised, and True once data was fetched, even if the webhook post failed
+    """
+    if SHUTDOWN.is_set():
+        return collector.spec.name, "Skipped (shutting down)", False
+    try:
+        payload = collector.collect()
+    except ServarrConnectionError as e:
+        logger.error(f"[{collector.spec.name}] {e}")
+        return collector.spec.name, str(e), False
+    except ServarrAuthenticationError as e:
+        logger.error(f"[{collector.spec.name}] {e}")
+        return collector.spec.name, str(e), False
+    except Exception as e:
+        logger.error(f"[{collector.spec.name}] Collection failed: {e}")
+        return collector.spec.name, str(e), False
+
+    if SHUTDOWN.is_set():
+        return collector.spec.name, "Skipped (shutting down)", True
+    if collector.send(payload):
+        return collector.spec.name, None, True
+    return collector.spec.name, "Failed to send webhook", True
+
+
+def run_collection(collectors: Sequence[ServarrCollector], workers: int = 0) -> CollectionStatus:
+    """Run collection for all instances concurrently.
+
+    Args:
+        collectors: Instances to collect from
+        workers: Maximum instances to collect at once (0 = one per instance),
+            capped at MAX_WORKERS
+    """
+    logger.info("Starting collection cycle at %s", datetime.now())
     succeeded = []
     failed = []
-
-    for collector in collectors:
-        try:
-            payload = collector.collect()
-            if collector.send(payload):
-                succeeded.append(collector.name)
+    collected_any = False
+
+    # Each instance is independent and I/O-bound, so run them in parallel
+    max_workers = min(workers or len(collectors), MAX_WORKERS)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(_run_one, c): c for c in collectors}
+        for future in as_completed(futures):
+            name, reason, collected = future.result()
+            collected_any = collected_any or collected
+            if reason is None:
+                succeeded.append(name)
             else:
-                failed.append((collector.name, "Failed to send webhook"))
-        except ServarrConnectionError as e:
-            logger.error(f"[{collector.name}] {e}")
-            failed.append((collector.name, str(e)))
-        except ServarrAuthenticationError as e:
-            logger.error(f"[{collector.name}] {e}")
-            failed.append((collector.name, str(e)))
-        except Exception as e:
-            logger.error(f"[{collector.name}] Collection failed: {e}")
-            failed.append((collector.name, str(e)))
+                failed.append((name, reason))
 
     # Log summary
     total = len(collectors)
     if failed:
-        logger.warning(f"Collection complete: {len(succeeded)}/{total} succeeded, {len(failed)} failed")
+        logger.warning("Collection complete: %d/%d succeeded, %d failed", len(succeeded), total, len(failed))
         for name, reason in failed:
-            logger.warning(f"  - {name}: {reason}")
+            logger.warning("  - %s: %s", name, reason)
     else:
-        logger.info(f"Collection complete: {len(succeeded)}/{total} succeeded")
+        logger.info("Collection complete: %d/%d succeeded", len(succeeded), total)
 
-    return len(failed) == 0
+    if not failed:
+        return CollectionStatus.OK
+    # Webhook failures don't count here - retrying sooner would only add to
+    # TRMNL's rate limiting
+    if collected_any:
+        return CollectionStatus.PARTIAL
+    return CollectionStatus.FAILED
 
 
-def main():
+def main() -> int:
     parser = argparse.ArgumentParser(
         description='TRMNL Servarr Collector - Collect data from Servarr apps and send to TRMNL webhook',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -777,9 +1172,14 @@ Examples:
     parser.add_argument('-b', '--days-before', type=int, default=0, help='Calendar days back (default: 0)')
     parser.add_argument('-c', '--calendar-only', action='store_true', help='Only send calendar data')
     parser.add_argument('-z', '--timezone', default='', help='Timezone for date calculations')
-    parser.add_argument('-i', '--interval', type=int, default=0, help='Collection interval in seconds (0 = run once)')
+    parser.add_argument('-i', '--interval', type=int, default=0, help=f'Collection interval in seconds (0 = run once, minimum {MIN_INTERVAL})')
+    parser.add_argument('-W', '--workers', type=int, default=0,
+                        help=f'Max instances to collect concurrently (default: 0 = one per instance, maximum {MAX_WORKERS})')
     parser.add_argument('-v', '--verbose', action='store_true', help='Verbose output')
     parser.add_argument('--dry-run', action='store_true', help='Print JSON, don\'t send to webhook')
+    parser.add_argument('--force-detect', action='store_true',
+                        help='Re-detect app type on every collection instead of caching it')
+    parser.add_argument('--no-cache', action='store_true', help='Don\'t cache API responses between collections')
     parser.add_argument('--version', action='version', version=f'%(prog)s {VERSION}')
 
     args = parser.parse_args()
@@ -790,50 +1190,127 @@ Examples:
         try:
             config = load_config(args.config)
         except Exception as e:
-            logger.error(f"Failed to load config: {e}")
-            sys.exit(1)
+            logger.error("Failed to load config: %s", e)
+            return 1
 
         # Get interval from config or CLI
         interval = config.get('interval', args.interval)
-        collectors = create_collectors_from_config(config, args)
-
-        if not collectors:
-            logger.error("No instances defined in config file")
-            sys.exit(1)
+        workers = config.get('workers', args.workers)
     else:
         # CLI mode - require URL and API key
         if not args.url or not args.api_key:
             logger.error("Either --config or both --url and --api-key are required")
             parser.print_help()
-            sys.exit(1)
+            return 1
 
         interval = args.interval
-        collectors = [create_collector_from_args(args)]
+        workers = args.workers
+
+    if 0 < interval < MIN_INTERVAL:
+        logger.warning("Interval %ds is below the minimum of %ds; using %ds", interval, MIN_INTERVAL, MIN_INTERVAL)
+        interval = MIN_INTERVAL
+
+    try:
+        workers = resolve_workers(workers)
+    except ValueError as e:
+        logger.error("Invalid configuration: %s", e)
+        return 1
+
+    if args.config:
+        try:
+            specs = create_specs_from_config(config, args, interval)
+        except ValueError as e:
+            logger.error("Failed to load config: %s", e)
+            return 1
+        if not specs:
+            logger.error("No instances defined in config file")
+            return 1
+    else:
+        specs = (create_spec_from_args(args, interval),)
+    collectors = build_collectors(specs)
 
-    logger.info(f"TRMNL Servarr Collector v{VERSION}")
-    logger.info(f"Loaded {len(collectors)} instance(s)")
+    logger.info("TRMNL Servarr Collector v%s", VERSION)
+    logger.info("Loaded %d instance(s)", len(collectors))
 
-    # Setup signal handlers
+    # Setup signal handlers - only flag shutdown so in-flight requests finish
     def signal_handler(signum, frame):
-        logger.info("Shutting down...")
-        sys.exit(0)
+        SHUTDOWN.set()
+
+    def reload_handler(signum, frame):
+        RELOAD.set()
 
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
+    if args.config and hasattr(signal, 'SIGHUP'):
+        signal.signal(signal.SIGHUP, reload_handler)
+
+    def reload_collectors():
+        """Rebuild collectors if the config file changed or SIGHUP was received."""
+        nonlocal config, collectors, workers
+        if RELOAD.is_set():
+            RELOAD.clear()
+            _CONFIG_CACHE.pop(args.config, None)
+        try:
+            new_config = load_config(args.config)
+            if new_config is config:
+                return
+            new_workers = resolve_workers(new_config.get('workers', args.workers))
+            new_collectors = build_collectors(create_specs_from_config(new_config, args, interval), collectors)
+        except Exception as e:
+            logger.error("Failed to reload config, keeping current instances: %s", e)
+            return
+        if not new_collectors:
+            logger.error("No instances defined in reloaded config, keeping current instances")
+            return
+        config = new_config
+        collectors = new_collectors
+        workers = new_workers
+        logger.info("Reloaded config: %d instance(s)", len(collectors))
 
     # Run collection
     if interval > 0:
-        logger.info(f"Running continuously with {interval}s interval (Ctrl+C to stop)")
-        while True:
-            run_collection(collectors)
-            logger.info(f"Sleeping for {interval} seconds...")
-            time.sleep(interval)
+        logger.info("Running continuously with %ds interval (Ctrl+C to stop)", interval)
+        # Schedule against a monotonic deadline so collection time doesn't
+        # push every later cycle back
+        next_deadline = time.monotonic()
+        fail_streak = 0
+        while not SHUTDOWN.is_set():
+            if args.config:
+                reload_collectors()
+            status = run_collection(collectors, workers)
+            if SHUTDOWN.is_set():
+                break
+
+            if status is CollectionStatus.FAILED:
+                # No instance could be reached or collected (e.g. all *arr
+                # instances down, DNS outage) - retry sooner, backing off
+                # 5s, 10s, 20s, ... up to the normal interval
+                fail_streak = min(fail_streak + 1, 6)
+                delay = min(interval, 5 * 2 ** (fail_streak - 1))
+                logger.warning("All collections failed (%d in a row), retrying in %ds", fail_streak, delay)
+                next_deadline = time.monotonic() + delay
+            else:
+                fail_streak = 0
+                next_deadline += interval
+                delay = next_deadline - time.monotonic()
+                if delay < 0:
+                    # Missed a tick - skip forward to the next aligned slot
+                    missed = int(-delay // interval) + 1
+                    logger.warning("Collection overran by %.1fs, skipped %d tick(s)", -delay, missed)
+                    next_deadline += missed * interval
+                    delay = next_deadline - time.monotonic()
+            logger.debug("Sleeping for %.0f seconds...", delay)
+            # The lock wait behind Event.wait() is interrupted by signals on the
+            # main thread, so a SIGTERM wakes this immediately - no wakeup fd needed
+            SHUTDOWN.wait(delay)
+        logger.info("Shutting down...")
+        return 0
     else:
         # Single run
-        success = run_collection(collectors)
+        status = run_collection(collectors, workers)
         logger.info("Done!")
-        sys.exit(0 if success else 1)
+        return 0 if status is CollectionStatus.OK else 1
 
 
 if __name__ == '__main__':
-    main()
+    raise SystemExit(main())